@@ -8,16 +8,17 @@ import math
 import logging
 import uuid
 from operator import attrgetter, itemgetter
-from typing import Tuple, List, Sequence, Generator, Callable, Dict, Union, Optional
+from typing import Tuple, List, Sequence, Generator, Callable, Dict, Union, Optional, Any
 import enum
 
+import numpy as np
 from shapely.geometry.polygon import Polygon
 from shapely.geometry import Point, LineString, LinearRing
 
 import libs.mesh.transformation as transformation
 from libs.utils.custom_exceptions import OutsideFaceError, OutsideVertexError
 from libs.utils.custom_types import Vector2d, SpaceCutCb, Coords2d, TwoEdgesAndAFace
-from libs.utils.geometry import magnitude, ccw_angle
+from libs.utils.geometry import ccw_angle
 from libs.utils.geometry import (
     unit_vector,
     unit,
@@ -29,9 +30,18 @@ from libs.utils.geometry import (
     normal_vector,
     truncate,
     distance,
-    project_point_on_segment
+    project_point_on_segment,
+    project_point_on_segments
+)
+from libs.read_write.plot import (
+    random_color,
+    make_arrow,
+    plot_polygon,
+    plot_polygons,
+    plot_edge,
+    plot_edges,
+    plot_save
 )
-from libs.read_write.plot import random_color, make_arrow, plot_polygon, plot_edge, plot_save
 
 # MODULE CONSTANTS
 
@@ -146,7 +156,7 @@ class MeshComponent:
         :return:
         """
         if not self._mesh:
-            logging.warning('Component has no mesh to remove it from: {0}'.format(self))
+            logging.warning('Component has no mesh to remove it from: %s', self)
             return
         self._mesh.remove(self)
 
@@ -176,7 +186,7 @@ class Vertex(MeshComponent):
 
     type = MeshComponentType.VERTEX
 
-    __slots__ = '_x', '_y', '_edge', 'mutable'
+    __slots__ = '_x', '_y', '_edge', 'mutable', '_cached_edges'
 
     def __init__(self,
                  mesh: 'Mesh',
@@ -196,6 +206,8 @@ class Vertex(MeshComponent):
         self._y = truncate(y)
         self._edge = edge
         self.mutable = mutable
+        # for caching purpose : (version of the mesh, edges starting from the vertex)
+        self._cached_edges: Optional[Tuple[int, List['Edge']]] = None
         super().__init__(mesh, _id)
 
     def __repr__(self):
@@ -215,7 +227,12 @@ class Vertex(MeshComponent):
         property
         Sets the x coordinate
         """
-        self._x = truncate(float(value))
+        old_x = self._x
+        self._x = truncate(value)
+        mesh = self._mesh
+        if mesh is not None:
+            mesh.version += 1
+            mesh.move_vertex(self, old_x, self._y)
 
     @property
     def y(self) -> float:
@@ -231,7 +248,12 @@ class Vertex(MeshComponent):
         property
         Sets the y coordinate
         """
-        self._y = truncate(float(value))
+        old_y = self._y
+        self._y = truncate(value)
+        mesh = self._mesh
+        if mesh is not None:
+            mesh.version += 1
+            mesh.move_vertex(self, self._x, old_y)
 
     @property
     def edge(self):
@@ -248,6 +270,9 @@ class Vertex(MeshComponent):
         Sets the edge the vertex starts
         """
         self._edge = value
+        mesh = self._mesh
+        if mesh is not None:
+            mesh.version += 1
 
     @property
     def coords(self) -> Coords2d:
@@ -264,8 +289,15 @@ class Vertex(MeshComponent):
         :param value:
         :return:
         """
-        self.x = value[0]
-        self.y = value[1]
+        # Note : for performance purposes we set both coordinates before updating the mesh
+        # instead of using the x and y setters
+        old_x, old_y = self._x, self._y
+        self._x = truncate(value[0])
+        self._y = truncate(value[1])
+        mesh = self._mesh
+        if mesh is not None:
+            mesh.version += 1
+            mesh.move_vertex(self, old_x, old_y)
 
     @property
     def as_sp(self):
@@ -279,10 +311,53 @@ class Vertex(MeshComponent):
     def edges(self) -> Generator['Edge', 'Edge', None]:
         """
         Returns all edges starting from the vertex
+        Note : the edges are cached until the next modification of the mesh. If the mesh
+        is modified during the iteration, we walk around the vertex from the last yielded edge.
+        :return: generator
+        """
+        mesh = self._mesh
+        if mesh is None or self._edge is None:
+            yield self.edge
+            yield from self._walk_edges(self.edge.previous.pair)
+            return
+
+        version = mesh.version
+        for edge in self._cached_edges_list():
+            yield edge
+            if mesh.version != version:
+                yield from self._walk_edges(edge.previous.pair)
+                return
+
+    def edges_list(self) -> List['Edge']:
+        """
+        Returns the list of the edges starting from the vertex.
+        Faster than materializing the edges generator.
+        :return: a list of edges
+        """
+        if self._mesh is None or self._edge is None:
+            return list(self.edges)
+        return list(self._cached_edges_list())
+
+    def _cached_edges_list(self) -> List['Edge']:
+        """
+        Returns the cached list of the edges starting from the vertex.
+        Note : the list is cached until the next modification of the mesh and must not be
+        modified by the caller
+        :return: a list of edges
+        """
+        version = self._mesh.version
+        if self._cached_edges is None or self._cached_edges[0] != version:
+            edges = [self._edge]
+            edges.extend(self._walk_edges(self._edge.previous.pair))
+            self._cached_edges = version, edges
+        return self._cached_edges[1]
+
+    def _walk_edges(self, edge: 'Edge') -> Generator['Edge', 'Edge', None]:
+        """
+        Walks around the vertex from the specified edge until the edge of the vertex
+        :param edge: the first yielded edge
         :return: generator
         """
-        yield self.edge
-        edge = self.edge.previous.pair
         while edge is not self.edge:
             yield edge
             edge = edge.previous.pair
@@ -298,7 +373,7 @@ class Vertex(MeshComponent):
         if not self.mutable:
             return []
 
-        edges = list(self.edges)
+        edges = self.edges_list()
         nb_edges = len(edges)
         # check the number of edges starting from the vertex
         if nb_edges > 2:
@@ -353,37 +428,37 @@ class Vertex(MeshComponent):
         :return: a tuple containing the new vertex and the associated edge, and the distance from
         the projected vertex
         """
-        # iterate trough every edge of the face
-        closest_edge = None
-        closest_point = None
-        shortest_distance = math.inf
-        for edge in face.edges:
-
-            if dot_product(edge.normal, vector) >= 0:
-                continue
-
-            # do not project on edges that starts or end with the vertex
-            if self in (edge.start, edge.end):
-                continue
-
-            projected_point = project_point_on_segment(self.coords, vector,
-                                                       (edge.start.coords, edge.end.coords),
-                                                       epsilon=COORD_EPSILON)
-            if projected_point is None:
-                continue
-
-            distance_to_point = distance(projected_point, self.coords)
-            if distance_to_point < shortest_distance:
-                closest_edge = edge
-                closest_point = projected_point
-                shortest_distance = distance_to_point
-
-        if not closest_point:
+        # Note : for performance purposes the projection is vectorized on every edge of the face
+        edges, segments, vertices_id = face.segments()
+        start_x, start_y, end_x, end_y = (segments[:, 0], segments[:, 1],
+                                          segments[:, 2], segments[:, 3])
+
+        # only project on the edges facing the vector
+        vector_x, vector_y = end_x - start_x, end_y - start_y
+        with np.errstate(divide='ignore', invalid='ignore'):
+            length = np.sqrt(vector_x ** 2 + vector_y ** 2)
+            facing = ((length != 0)
+                      & ((-vector_y / length) * vector[0] + (vector_x / length) * vector[1] < 0))
+
+        # do not project on edges that starts or end with the vertex
+        facing &= (vertices_id[:, 0] != self.id) & (vertices_id[:, 1] != self.id)
+
+        projected_x, projected_y, found = project_point_on_segments(self.coords, vector, segments,
+                                                                    epsilon=COORD_EPSILON)
+        found &= facing
+        if not found.any():
             return None
 
+        distances = np.sqrt((projected_x - self.x) ** 2 + (projected_y - self.y) ** 2)
+        # the first edge with the shortest distance is selected
+        i = int(np.argmin(np.where(found, distances, np.inf)))
+        closest_edge = edges[i]
+        closest_point = float(projected_x[i]), float(projected_y[i])
+        shortest_distance = float(distances[i])
+
         new_vertex = Vertex(face.mesh, *closest_point)
 
-        return (new_vertex, closest_edge, shortest_distance) if closest_edge else None
+        return new_vertex, closest_edge, shortest_distance
 
     def distance_to(self, other: 'Vertex') -> float:
         """
@@ -391,8 +466,8 @@ class Vertex(MeshComponent):
         :param other: vertex
         :return: float
         """
-        vector = self.x - other.x, self.y - other.y
-        return magnitude(vector)
+        # Note : for performance purposes we do not use the numpy based magnitude function
+        return math.sqrt((self._x - other.x) ** 2 + (self._y - other.y) ** 2)
 
     def snap_to(self, *others: 'Vertex') -> 'Vertex':
         """
@@ -412,7 +487,7 @@ class Vertex(MeshComponent):
             if self.is_close(other):
                 # ensure that the reference to the vertex are still valid
                 if self.edge is not None:
-                    for edge in list(self.edges):
+                    for edge in self.edges_list():
                         edge.start = other
                     self.edge = None
                 # remove the vertex from the mesh
@@ -432,7 +507,21 @@ class Vertex(MeshComponent):
         best_edge = None
         min_angle = None
         vector = self.edge.vector if self.edge else None
+        # Note : for performance purposes we first check the bounding box of each edge
+        # to discard the edges that are too far from the vertex without calling the
+        # snapping and the projection functions (the projected point can be
+        # at a COORD_EPSILON distance from the extremities of the edge)
+        margin = 2 * COORD_EPSILON
         for edge in edges:
+            start, end = edge.start, edge.end
+            if self is not start and self is not end:
+                x, y = self.x, self.y
+                if ((x < start.x - margin and x < end.x - margin)
+                        or (x > start.x + margin and x > end.x + margin)
+                        or (y < start.y - margin and y < end.y - margin)
+                        or (y > start.y + margin and y > end.y + margin)):
+                    continue
+
             new_edge = None
             # if the vertex has an edge we make sure that we snap to the correct edge pair.
             # this is needed only for internal edge
@@ -511,7 +600,7 @@ class Edge(MeshComponent):
 
     type = MeshComponentType.EDGE
 
-    __slots__ = '_start', '_next', '_face', '_pair'
+    __slots__ = '_start', '_next', '_face', '_pair', '_cached_previous'
 
     def __init__(self, mesh: 'Mesh', start: Optional[Vertex] = None,
                  next_edge: Optional['Edge'] = None, pair: Optional['Edge'] = None,
@@ -531,12 +620,16 @@ class Edge(MeshComponent):
         self._next = next_edge
         self._face = face
         self._pair = pair
+        self._cached_previous: Optional[Tuple[int, 'Edge']] = None
         # ensure that the pair edge is reciprocal
+        # note: no need to use the pair setter as self._pair is already set
         if pair is not None:
-            pair.pair = self
+            pair._pair = self
         # check the size of the edge (not really useful)
         super().__init__(mesh, _id)
-        self.check_size()
+        # note: the size is meaningless until the edge has a start and a next edge
+        if start is not None and next_edge is not None:
+            self.check_size()
 
     def __repr__(self):
         output = 'Edge:[({x1}, {y1}), ({x2}, {y2})] - {i}'.format(x1=self.start.x,
@@ -561,6 +654,9 @@ class Edge(MeshComponent):
         Sets the starting vertex of the edge
         """
         self._start = value
+        mesh = self._mesh
+        if mesh is not None:
+            mesh.version += 1
 
     @property
     def pair(self) -> 'Edge':
@@ -580,6 +676,9 @@ class Edge(MeshComponent):
         # a pair should always be reciprocal
         # note: we cannot use the setter because it will induce an infinite loop
         value._pair = self
+        mesh = self._mesh
+        if mesh is not None:
+            mesh.version += 1
 
     @property
     def next(self) -> 'Edge':
@@ -596,9 +695,13 @@ class Edge(MeshComponent):
         Sets the next Edge of the edge
         """
         self._next = value
+        mesh = self._mesh
+        if mesh is not None:
+            mesh.version += 1
         # check the size
         # TODO: is this necessary ?
-        self.check_size()
+        if value is not None and self._start is not None:
+            self.check_size()
 
     @property
     def face(self) -> Optional['Face']:
@@ -615,6 +718,9 @@ class Edge(MeshComponent):
         Sets the face of the edge
         """
         self._face = value  # should be None for a boundary edge
+        mesh = self._mesh
+        if mesh is not None:
+            mesh.version += 1
 
     @property
     def is_mesh_boundary(self):
@@ -644,8 +750,8 @@ class Edge(MeshComponent):
              +               +
         :return:
         """
-        number_edges_start = len(list(self.start.edges)) - 1
-        number_edges_end = len(list(self.end.edges)) - 1
+        number_edges_start = len(self.start.edges_list()) - 1
+        number_edges_end = len(self.end.edges_list()) - 1
         return number_edges_end + number_edges_start
 
     @property
@@ -688,8 +794,7 @@ class Edge(MeshComponent):
         using a pseudo equality on the angle
         :return: boolean
         """
-        is_aligned = pseudo_equal(self.next_angle, 180, ANGLE_EPSILON)
-        return is_aligned
+        return abs(self.next_angle - 180.0) < ANGLE_EPSILON
 
     @property
     def previous_is_aligned(self) -> bool:
@@ -698,8 +803,7 @@ class Edge(MeshComponent):
         using a pseudo equality on the angle
         :return: boolean
         """
-        is_aligned = pseudo_equal(self.previous_angle, 180, ANGLE_EPSILON)
-        return is_aligned
+        return abs(self.previous_angle - 180.0) < ANGLE_EPSILON
 
     @property
     def next_is_ortho(self) -> bool:
@@ -707,7 +811,7 @@ class Edge(MeshComponent):
         Indicates if the next edge is orthogonal
         :return:
         """
-        return pseudo_equal(self.next_angle, 90, ANGLE_EPSILON)
+        return abs(self.next_angle - 90.0) < ANGLE_EPSILON
 
     def next_ortho(self) -> 'Edge':
         """
@@ -741,7 +845,7 @@ class Edge(MeshComponent):
         Indicates if the next edge i
         :return:
         """
-        return pseudo_equal(self.previous_angle, 90, ANGLE_EPSILON)
+        return abs(self.previous_angle - 90.0) < ANGLE_EPSILON
 
     @property
     def length(self) -> float:
@@ -791,15 +895,26 @@ class Edge(MeshComponent):
         """
         Returns the previous edge by looping through the whole face.
         Will fail if the edge is not a member of a proper formed face.
+        Note : for performance purposes, while looping through the face we store the previous
+        edge of each edge of the face until the next modification of the mesh
         :return: edge
         """
+        mesh = self._mesh
+        version = mesh.version if mesh is not None else None
+        cached_previous = self._cached_previous
+        if version is not None and cached_previous is not None and cached_previous[0] == version:
+            return cached_previous[1]
+
         for edge in self.siblings:
-            if edge.next is None:
+            next_edge = edge.next
+            if next_edge is None:
                 # Note : we could actually allow
                 # this but I think this better for debugging purposes
                 raise Exception('The face is badly formed :' +
                                 ' one of the edge has not a next edge')
-            if edge.next is self:
+            if version is not None:
+                next_edge._cached_previous = version, edge
+            if next_edge is self:
                 return edge
         raise Exception('Not previous edge found !')
 
@@ -827,13 +942,15 @@ class Edge(MeshComponent):
         A CCW normal of the edge of length 1
         :return: a tuple containing x, y values
         """
+        # Note : for performance purposes we compute the vector and the length of the edge
+        # only once instead of calling the length and vector properties several times
+        vector_x, vector_y = self.vector
+        length = math.sqrt(vector_y ** 2 + vector_x ** 2)
         # per convention if the edge is of length 0 we return the 0, 0 vector
-        if self.length == 0:
+        if length == 0:
             return 0, 0
 
-        x, y = -self.vector[1], self.vector[0]
-        length = math.sqrt(x ** 2 + y ** 2)
-        return x / length, y / length
+        return -vector_y / length, vector_x / length
 
     @property
     def depth(self) -> float:
@@ -958,17 +1075,40 @@ class Edge(MeshComponent):
         yield self
         edge = self.next
         # in order to detect infinite loop we stored each yielded edge
+        # note : for performance purposes we store the identity of the edges in a set
         if __debug__:
-            seen = []
+            seen = set()
         while edge is not self:
-            if __debug__ and edge in seen:
+            if __debug__ and id(edge) in seen:
                 raise Exception('Infinite loop' +
                                 ' starting from edge:{0}'.format(self))
             if __debug__:
-                seen.append(edge)
+                seen.add(id(edge))
             yield edge
             edge = edge.next
 
+    # noinspection PyUnreachableCode
+    def siblings_list(self) -> List['Edge']:
+        """
+        Returns the list of the siblings of the edge, starting with itself.
+        Faster than materializing the siblings generator.
+        :return: a list of the edges in the loop
+        """
+        siblings = [self]
+        append = siblings.append
+        edge = self.next
+        if __debug__:
+            seen = set()
+        while edge is not self:
+            if __debug__:
+                if id(edge) in seen:
+                    raise Exception('Infinite loop' +
+                                    ' starting from edge:{0}'.format(self))
+                seen.add(id(edge))
+            append(edge)
+            edge = edge.next
+        return siblings
+
     # noinspection PyUnreachableCode
     @property
     def reverse_siblings(self) -> Generator['Edge', 'Edge', None]:
@@ -981,13 +1121,13 @@ class Edge(MeshComponent):
         edge = self.previous
         # in order to detect infinite loop we stored each yielded edge
         if __debug__:
-            seen = []
+            seen = set()
         while edge is not self:
             if __debug__:
-                if edge in seen:
+                if id(edge) in seen:
                     raise Exception('Infinite loop' +
                                     ' starting from edge:{0}'.format(self))
-                seen.append(edge)
+                seen.add(id(edge))
             yield edge
             edge = edge.previous
 
@@ -1025,12 +1165,16 @@ class Edge(MeshComponent):
             current = current.aligned_edge or current.continuous_edge
 
         # going backward
+        # Note : for performance purposes we append the edges and reverse the list once
+        # instead of prepending each edge to the output
+        backward = []
         current = self.pair.aligned_edge or self.pair.continuous_edge
         while current:
-            output = [current.pair] + output
+            backward.append(current.pair)
             current = current.aligned_edge or current.continuous_edge
 
-        return output
+        backward.reverse()
+        return backward + output
 
     @property
     def aligned_edge(self) -> Optional['Edge']:
@@ -1050,7 +1194,8 @@ class Edge(MeshComponent):
         for _edge in self.end.edges:
             if _edge.pair is self:
                 continue
-            if pseudo_equal(ccw_angle(self.vector, _edge.opposite_vector), 180, ANGLE_EPSILON):
+            # Note : for performance purposes we inline the pseudo equality of the angle
+            if abs(ccw_angle(self.vector, _edge.opposite_vector) - 180.0) < ANGLE_EPSILON:
                 return _edge
 
         return None
@@ -1077,14 +1222,17 @@ class Edge(MeshComponent):
         edges = [self.pair]
         current = self.next
         while current is not self.pair:
+            # Note : for performance purposes we stop as soon as there are more than 4 edges
+            if len(edges) == 4:
+                return None
             edges.append(current)
             current = current.pair.next
 
         if len(edges) != 4:
             return None
 
-        if not pseudo_equal(ccw_angle(edges[1].vector, edges[3].vector),
-                            180.0, ANGLE_EPSILON):
+        # Note : for performance purposes we inline the pseudo equality of the angle
+        if abs(ccw_angle(edges[1].vector, edges[3].vector) - 180.0) >= ANGLE_EPSILON:
             return None
 
         return edges[2]
@@ -1111,13 +1259,19 @@ class Edge(MeshComponent):
 
     def barycenter(self, coeff: float) -> Vertex:
         """
-        Returns True if the edge contains the vertex
+        Creates a vertex at the barycentric position on the edge
+        :param coeff: barycentric coefficient (0 : start vertex, 1 : end vertex)
         :return: vertex
         """
-        vertex = (transformation.get['barycenter']
-                  .config(vertex=self.end, coeff=coeff)
-                  .apply_to(self.start))
-        return vertex
+        if coeff is None or coeff > 1 or coeff < 0:
+            raise ValueError('A barycenter coefficient' +
+                             'should have a value between 0 and 1: {0}'.format(coeff))
+        # Note : for performance purposes we directly compute the coordinates of the vertex
+        # instead of configuring and applying the barycenter transformation
+        start, end = self.start, self.end
+        return Vertex(self.mesh,
+                      start.x + (end.x - start.x) * coeff,
+                      start.y + (end.y - start.y) * coeff)
 
     def collapse(self):
         """
@@ -1166,7 +1320,7 @@ class Edge(MeshComponent):
                 raise ValueError('cannot remove an edge that will create an' +
                                  ' unconnected hole in a face: {0}'.format(self))
 
-            logging.debug('Mesh: Removing an isolated edge: {0}'.format(self))
+            logging.debug('Mesh: Removing an isolated edge: %s', self)
             isolated_edge = self if self.next is self.pair else self.pair
             # remove end vertex from mesh
             isolated_edge.preserve_references(isolated_edge.pair.next)
@@ -1276,41 +1430,46 @@ class Edge(MeshComponent):
         :param other: the edge to link to
         :return: the created face, the initial face if modified, None if the mesh was not modified
         """
+        # Note : for performance purposes we bind the attributes to local variables
+        face = self.face
+        self_next, other_next = self.next, other.next
+
         # check if the edges have the same face
-        if self.face is not other.face:
+        if face is not other.face:
             raise ValueError('Cannot link two edges that do not share the same face: ' +
                              '{0}-{1}'.format(self, other))
 
         # check if the edges are already linked
-        if other.next is self or self.next is other:
+        if other_next is self or self_next is other:
             # APP-7308: Second pass for warnings
             logging.info('Mesh: Cannot link two edges that are already linked:%s-%s', self, other)
             return None
 
         # check if the edges are the same
-        if self.end is other.end:
-            logging.warning('cannot link one vertex to itself ' +
-                            ':{0}-{1}'.format(self, other))
+        self_end, other_end = self_next.start, other_next.start
+        if self_end is other_end:
+            logging.warning('cannot link one vertex to itself :%s-%s', self, other)
             return None
 
         # Create the new edge and its pair
-        new_edge = Edge(self.mesh, self.end, other.next, face=self.face)
-        self.face.edge = self  # preserve split face edge reference
-        new_edge.pair = Edge(self.mesh, other.end, self.next, pair=new_edge)
+        mesh = self.mesh
+        new_edge = Edge(mesh, self_end, other_next, face=face)
+        face.edge = self  # preserve split face edge reference
+        new_edge_pair = Edge(mesh, other_end, self_next, pair=new_edge)
 
         # modify initial edges next edges to follow the laser_cut
         self.next = new_edge
-        other.next = new_edge.pair
+        other.next = new_edge_pair
 
         # create a new face
-        new_face = Face(self.mesh, new_edge.pair)
+        new_face = Face(mesh, new_edge_pair)
 
         # assign all the edges from one side of the laser_cut to the new face
-        for edge in new_edge.pair.siblings:
+        for edge in new_edge_pair.siblings_list():
             edge.face = new_face
 
         # store the specific mesh operation
-        self.mesh.store_modification(MeshOps.INSERT, new_face, self.face)
+        mesh.store_modification(MeshOps.INSERT, new_face, face)
 
         return new_face
 
@@ -1334,63 +1493,65 @@ class Edge(MeshComponent):
         :param callback: Optional
         :return: self
         """
-        # do not cut an edge on the boundary
-        if self.face is None:
-            return None
+        # Note : for performance purposes, the traversal of the faces is done with a loop
+        # instead of recursive calls. We keep the last cut data for the case where
+        # the next cut is unfruitful
+        edge = self
+        last_edges_and_face = None
 
-        # a relative angle or a vector
-        # can be provided as arguments of the method
-        if vector is not None:
-            angle = ccw_angle(self.vector, vector)
-        else:
-            vector = unit_vector(ccw_angle(self.vector) + angle)
+        while True:
+            # do not cut an edge on the boundary
+            if edge.face is None:
+                return last_edges_and_face
 
-        # try to cut the edge
-        new_edges_and_face = self.cut(vertex, angle, vector=vector, max_length=max_length)
+            # a relative angle or a vector
+            # can be provided as arguments of the method
+            if vector is not None:
+                angle = ccw_angle(edge.vector, vector)
+            else:
+                vector = unit_vector(ccw_angle(edge.vector) + angle)
 
-        # if the cut fail we stop
-        if new_edges_and_face is None:
-            return None
+            # try to cut the edge
+            new_edges_and_face = edge.cut(vertex, angle, vector=vector, max_length=max_length)
 
-        # do not continue to cut if not needed
-        if traverse not in ("absolute", "relative"):
-            if callback:
-                callback(new_edges_and_face)
-            return new_edges_and_face
-
-        new_edge_start, new_edge_end, new_face = new_edges_and_face
-
-        # check if we have the correct new_edge_end
-        # a correct edge should enable a next cut
-        correct_edge: 'Edge' = new_edge_end
-        next_angle = ccw_angle(correct_edge.pair.vector, vector)
-        while (not correct_edge.pair._angle_inside_face(next_angle)
-               and correct_edge is not new_edge_end):
-            correct_edge = correct_edge.cw
+            # if the cut fail we stop
+            if new_edges_and_face is None:
+                return last_edges_and_face
+
+            # do not continue to cut if not needed
+            if traverse not in ("absolute", "relative"):
+                if callback:
+                    callback(new_edges_and_face)
+                return new_edges_and_face
+
+            new_edge_start, new_edge_end, new_face = new_edges_and_face
+
+            # check if we have the correct new_edge_end
+            # a correct edge should enable a next cut
+            correct_edge: 'Edge' = new_edge_end
             next_angle = ccw_angle(correct_edge.pair.vector, vector)
-        new_edge_end = correct_edge
-
-        new_edges_and_face = new_edge_start, new_edge_end, new_face
-
-        # call the callback to check if the cut should stop
-        if callback and callback(new_edges_and_face):
-            return new_edges_and_face
-
-        # check the distance
-        if max_length is not None and new_edge_start is not None:
-            distance_traveled = new_edge_start.start.distance_to(new_edge_end.start)
-            max_length -= distance_traveled
-
-        # laser_cut the next edge if traverse option is set
-        # if the new cut is unfruitful we do not return None but the last cut data
-        vector = vector if traverse == 'absolute' else None
-        new_edges_and_face = (new_edge_end.pair.recursive_cut(new_edge_end.start, angle,
-                                                              traverse=traverse,
-                                                              vector=vector,
-                                                              max_length=max_length,
-                                                              callback=callback)
-                              or new_edges_and_face)
-        return new_edges_and_face
+            while (not correct_edge.pair._angle_inside_face(next_angle)
+                   and correct_edge is not new_edge_end):
+                correct_edge = correct_edge.cw
+                next_angle = ccw_angle(correct_edge.pair.vector, vector)
+            new_edge_end = correct_edge
+
+            new_edges_and_face = new_edge_start, new_edge_end, new_face
+
+            # call the callback to check if the cut should stop
+            if callback and callback(new_edges_and_face):
+                return new_edges_and_face
+
+            # check the distance
+            if max_length is not None and new_edge_start is not None:
+                distance_traveled = new_edge_start.start.distance_to(new_edge_end.start)
+                max_length -= distance_traveled
+
+            # laser_cut the next edge if traverse option is set
+            # if the new cut is unfruitful we do not return None but the last cut data
+            last_edges_and_face = new_edges_and_face
+            vector = vector if traverse == 'absolute' else None
+            edge, vertex = new_edge_end.pair, new_edge_end.start
 
     def _angle_inside_face(self, angle: float) -> bool:
         """
@@ -1400,8 +1561,8 @@ class Edge(MeshComponent):
         """
         angle_is_inside = 180 - MIN_ANGLE > angle > 180.0 - self.next_angle + MIN_ANGLE
         if not angle_is_inside:
-            logging.debug('Mesh: Cannot cut according to angle:{0} > {1} > {2}'.
-                          format(180 - MIN_ANGLE, angle, 180.0 - self.next_angle + MIN_ANGLE))
+            logging.debug('Mesh: Cannot cut according to angle:%s > %s > %s',
+                          180 - MIN_ANGLE, angle, 180.0 - self.next_angle + MIN_ANGLE)
             return False
         return True
 
@@ -1426,17 +1587,20 @@ class Edge(MeshComponent):
             return None
 
         first_edge = self
+        # Note : for performance purposes we bind the attributes to local variables
+        start, end = self.start, self.end
+        self_vector = end.x - start.x, end.y - start.y
 
         # a relative angle or a vector
         # can be provided as arguments of the method
         if vector is not None:
-            angle = ccw_angle(self.vector, vector)
+            angle = ccw_angle(self_vector, vector)
 
         # snap vertex if they are very close to the end or the start of the edge
-        vertex = vertex.snap_to(self.start, self.end)
+        vertex = vertex.snap_to(start, end)
 
         # check for extremity cases
-        if vertex is self.start:
+        if vertex is start:
             first_edge = self.previous
             angle = angle + 180.0 - self.previous_angle
 
@@ -1496,9 +1660,7 @@ class Edge(MeshComponent):
         elif coeff == 1:
             vertex = self.end
         else:
-            vertex = (transformation.get['barycenter']
-                      .config(vertex=self.end, coeff=coeff)
-                      .apply_to(self.start))
+            vertex = self.barycenter(coeff)
 
         cut_data = self.recursive_cut(vertex, angle, vector=vector, traverse=traverse)
 
@@ -1525,9 +1687,7 @@ class Edge(MeshComponent):
         elif coeff == 1:
             vertex = self.end
         else:
-            vertex = (transformation.get['barycenter']
-                      .config(vertex=self.end, coeff=coeff)
-                      .apply_to(self.start))
+            vertex = self.barycenter(coeff)
 
         cut_data = self.cut(vertex, angle, vector=vector)
 
@@ -1555,8 +1715,8 @@ class Edge(MeshComponent):
             angle = ccw_angle(self.vector, vector)
             angle_is_inside = MIN_ANGLE < angle < self.previous_angle - MIN_ANGLE
             if not angle_is_inside:
-                logging.debug('Mesh: Cannot cut according to angle:{0} < {1} < {2}'.
-                              format(MIN_ANGLE, angle, self.previous_angle - MIN_ANGLE))
+                logging.debug('Mesh: Cannot cut according to angle:%s < %s < %s',
+                              MIN_ANGLE, angle, self.previous_angle - MIN_ANGLE)
                 continue
 
             projected_vertex = (transformation.get['projection']
@@ -1635,36 +1795,41 @@ class Edge(MeshComponent):
         :param vertex: a vertex object where we should split
         :return: the newly created edge starting from the vertex
         """
+        # define edges names for clarity sake
+        # Note : for performance purposes we bind the attributes to local variables
+        edge = self
+        next_edge = self.next
+        start, end = self.start, next_edge.start
+
         # check for vertices proximity and snap if needed
-        vertex = vertex.snap_to(self.start, self.end)
+        vertex = vertex.snap_to(start, end)
 
         # check extremity cases : if the vertex is one of the extremities of the edge do nothing
-        if vertex is self.start:
+        if vertex is start:
             return self
-        if vertex is self.end:
-            return self.next
+        if vertex is end:
+            return next_edge
 
-        # define edges names for clarity sake
-        edge = self
-        next_edge = self.next
+        mesh = self.mesh
         edge_pair = self.pair
-        next_edge_pair = self.pair.next
+        next_edge_pair = edge_pair.next
 
         # create the two new half edges
-        new_edge = Edge(self.mesh, vertex, next_edge, edge_pair, edge.face)
-        new_edge_pair = Edge(self.mesh, vertex, next_edge_pair, edge, edge_pair.face)
+        # note : the next edges of the new half edges are set by the constructor
+        new_edge = Edge(mesh, vertex, next_edge, edge_pair, edge.face)
+        new_edge_pair = Edge(mesh, vertex, next_edge_pair, edge, edge_pair.face)
 
-        vertex.edge = vertex.edge if vertex.edge is not None else new_edge
+        if vertex.edge is None:
+            vertex.edge = new_edge
 
         # change the current edge destinations and starting point
-        new_edge_pair.next = next_edge_pair
-        new_edge.next = next_edge
         edge.next = new_edge
         edge_pair.next = new_edge_pair
 
         # store modification
-        self.mesh.store_modification(MeshOps.INSERT, new_edge, self)
-        self.mesh.store_modification(MeshOps.INSERT, new_edge_pair, self.pair)
+        # note : the pair of the edge is now the new pair edge
+        mesh.store_modification(MeshOps.INSERT, new_edge, self)
+        mesh.store_modification(MeshOps.INSERT, new_edge_pair, self.pair)
 
         return new_edge
 
@@ -1716,9 +1881,7 @@ class Edge(MeshComponent):
         :param coeff: float
         :return: self
         """
-        vertex = (transformation.get['barycenter']
-                  .config(vertex=self.end, coeff=coeff)
-                  .apply_to(self.start))
+        vertex = self.barycenter(coeff)
         return self.split(vertex)
 
     def plot(self, ax, color: str = 'black', save: Optional[bool] = None,
@@ -1733,6 +1896,13 @@ class Edge(MeshComponent):
         x_coords, y_coords = zip(*(self.start.coords, self.end.coords))
         return plot_edge(x_coords, y_coords, ax, color=color, save=save, width=width)
 
+    def half_edge_arrow(self) -> List[Coords2d]:
+        """
+        Returns the coordinates of the semi-arrow used to plot the half-edge
+        :return: a list of coordinates
+        """
+        return list(make_arrow(self.start.coords, self.vector, self.normal).coords)
+
     def plot_half_edge(self, ax, color: str = 'black', save: Optional[bool] = None):
         """
         Plots a semi-arrow to indicate half-edge for debugging purposes
@@ -1741,8 +1911,7 @@ class Edge(MeshComponent):
         :param save: whether to save the plot
         :return:
         """
-        arrow = make_arrow(self.start.coords, self.vector, self.normal)
-        x_coords, y_coords = zip(*arrow.coords)
+        x_coords, y_coords = zip(*self.half_edge_arrow())
         return plot_edge(x_coords, y_coords, ax, color=color, save=save)
 
     def plot_normal(self, ax, color: str = 'black'):
@@ -1761,12 +1930,17 @@ class Edge(MeshComponent):
 
     def check_size(self):
         """Checks the size of the edge"""
-        if self.start and self.end and self.start is self.end:
+        start = self._start
+        end = self._next.start if self._next is not None else None
+        if start is None or end is None:
+            return
+
+        if start is end:
             raise ValueError('Cannot create and edge starting and ending with the same ' +
-                             'vertex: {0}'.format(self.start))
+                             'vertex: {0}'.format(start))
 
-        if self.start and self.end and self.length < COORD_EPSILON / 4:
-            logging.info('Mesh: Created a very small edge: {0} - {1}'.format(self.start, self.end))
+        if start.distance_to(end) < COORD_EPSILON / 4:
+            logging.info('Mesh: Created a very small edge: %s - %s', start, end)
 
 
 class Face(MeshComponent):
@@ -1776,11 +1950,19 @@ class Face(MeshComponent):
 
     type = MeshComponentType.FACE
 
-    __slots__ = '_edge', '_cached_area'
+    __slots__ = '_edge', '_cached_area', '_cached_edges', '_cached_segments', '_cached_sp'
 
     def __init__(self, mesh: 'Mesh', edge: 'Edge', _id: Optional[int] = None):
 
         self._edge = edge
+        # for caching purpose : (version of the mesh, edge of the face, edges of the face)
+        self._cached_edges: Optional[Tuple[int, Edge, List[Edge]]] = None
+        # for caching purpose : (version of the mesh, edge of the face, edges of the face,
+        # coordinates of the edges, ids of the vertices of the edges)
+        self._cached_segments: Optional[Tuple[int, Edge, List[Edge],
+                                              np.ndarray, np.ndarray]] = None
+        # for caching purpose : (version of the mesh, edge of the face, shapely geometries)
+        self._cached_sp: Optional[Tuple[int, Edge, Dict[str, Any]]] = None
         super().__init__(mesh, _id)
 
         # for performance purposes
@@ -1832,6 +2014,9 @@ class Face(MeshComponent):
         Sets the edge of the face
         """
         self._edge = value
+        mesh = self._mesh
+        if mesh is not None:
+            mesh.version += 1
 
     @property
     def edges(self, from_edge: Optional[Edge] = None) -> Generator[Edge, None, None]:
@@ -1845,7 +2030,84 @@ class Face(MeshComponent):
         :return: a generator
         """
         edge = from_edge or self.edge
-        return edge.siblings
+        if self._mesh is None:
+            return edge.siblings
+        return self._cached_siblings(edge)
+
+    # noinspection PyUnreachableCode
+    def _cached_siblings(self, edge: Edge) -> Generator[Edge, None, None]:
+        """
+        Yields the siblings of the edge. The list of the edges of the face is cached until
+        the next modification of the mesh. If the mesh is modified during the iteration,
+        we follow each edge next from the last yielded edge as in Edge.siblings.
+        :param edge: the first edge of the loop
+        :return: a generator
+        """
+        mesh = self._mesh
+        version = mesh.version
+        for _edge in self._cached_edges_list(edge):
+            yield _edge
+            if mesh.version != version:
+                _edge = _edge.next
+                # in order to detect infinite loop we stored each yielded edge
+                if __debug__:
+                    seen = set()
+                while _edge is not edge:
+                    if __debug__ and id(_edge) in seen:
+                        raise Exception('Infinite loop' +
+                                        ' starting from edge:{0}'.format(edge))
+                    if __debug__:
+                        seen.add(id(_edge))
+                    yield _edge
+                    _edge = _edge.next
+                return
+
+    def edges_list(self) -> List[Edge]:
+        """
+        Returns the list of the edges of the face, starting from the edge of the face.
+        Faster than materializing the edges generator.
+        :return: a list of edges
+        """
+        if self._mesh is None:
+            return self.edge.siblings_list()
+        return list(self._cached_edges_list(self.edge))
+
+    def _cached_edges_list(self, edge: Edge) -> List[Edge]:
+        """
+        Returns the cached list of the siblings of the edge.
+        Note : the list is cached until the next modification of the mesh and must not be
+        modified by the caller
+        :param edge: the first edge of the loop
+        :return: a list of edges
+        """
+        version = self._mesh.version
+        cached_edges = self._cached_edges
+        if cached_edges is None or cached_edges[0] != version or cached_edges[1] is not edge:
+            cached_edges = version, edge, edge.siblings_list()
+            self._cached_edges = cached_edges
+        return cached_edges[2]
+
+    def segments(self) -> Tuple[List[Edge], np.ndarray, np.ndarray]:
+        """
+        Returns the edges of the face with two numpy arrays : the coordinates of the edges
+        (x_start, y_start, x_end, y_end) and the ids of their vertices (start_id, end_id).
+        Useful to perform vectorized computations on the edges of the face.
+        Note : the arrays are cached until the next modification of the mesh
+        :return: a tuple (edges, coordinates array, vertices ids array)
+        """
+        version = self.mesh.version if self.mesh else None
+        cached_segments = self._cached_segments
+        if (version is not None and cached_segments is not None
+                and cached_segments[0] == version and cached_segments[1] is self.edge):
+            return cached_segments[2:]
+
+        edges = self.edges_list()
+        coords = np.array([(edge.start.x, edge.start.y, edge.end.x, edge.end.y)
+                           for edge in edges], dtype=float)
+        ids = np.array([(edge.start.id, edge.end.id) for edge in edges])
+        if version is not None:
+            self._cached_segments = version, self.edge, edges, coords, ids
+        return edges, coords, ids
 
     @property
     def vertices(self) -> Generator[Vertex, None, None]:
@@ -1861,53 +2123,118 @@ class Face(MeshComponent):
         Returns the list of the coordinates of the face
         :return:
         """
-        return [vertex.coords for vertex in self.vertices]
+        return [edge.start.coords for edge in self.edges_list()]
+
+    def _sp_cache(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the dict storing the shapely geometries of the face. The dict is emptied
+        at each modification of the mesh.
+        Note : shapely geometries are immutable, so they can be safely shared between callers
+        :return: a dict or None if the face has no mesh
+        """
+        mesh = self._mesh
+        if mesh is None:
+            return None
+        cached_sp = self._cached_sp
+        if cached_sp is None or cached_sp[0] != mesh.version or cached_sp[1] is not self._edge:
+            cached_sp = mesh.version, self._edge, {}
+            self._cached_sp = cached_sp
+        return cached_sp[2]
 
     @property
     def as_sp(self) -> Polygon:
         """
         Returns a shapely Polygon corresponding to the face geometry
+        Note : the polygon is cached until the next modification of the mesh
         :return: Polygon
         """
-        list_vertices = [vertex.coords for vertex in self.vertices]
-        list_vertices.append(list_vertices[0])
-        return Polygon(list_vertices)
+        cache = self._sp_cache()
+        if cache is not None and "polygon" in cache:
+            return cache["polygon"]
+        # Note : for performance purposes we fill a preallocated array of coordinates
+        # instead of building a list of tuples
+        edges = self.edges_list()
+        num_edges = len(edges)
+        coords = np.empty((num_edges + 1, 2))
+        for i, edge in enumerate(edges):
+            vertex = edge.start
+            coords[i, 0] = vertex.x
+            coords[i, 1] = vertex.y
+        coords[num_edges] = coords[0]
+        polygon = Polygon(coords)
+        if cache is not None:
+            cache["polygon"] = polygon
+        return polygon
 
     @property
     def as_sp_linear_ring(self) -> LinearRing:
         """
         Returns a shapely LinearRing corresponding to the face perimeter
+        Note : the linear ring is cached until the next modification of the mesh
         :return: LinearRing
         """
+        cache = self._sp_cache()
+        if cache is not None and "linear_ring" in cache:
+            return cache["linear_ring"]
         list_vertices = [vertex.coords for vertex in self.vertices]
-        return LinearRing(list_vertices)
+        linear_ring = LinearRing(list_vertices)
+        if cache is not None:
+            cache["linear_ring"] = linear_ring
+        return linear_ring
 
     @property
     def as_sp_dilated(self) -> Polygon:
         """
         Returns a dilated Polygon corresponding to the face with a small buffer
         This is useful to prevent floating point precision errors.
+        Note : the polygon is cached until the next modification of the mesh
         :return: Polygon
         """
-        return self.as_sp.buffer(COORD_EPSILON, 1)
+        cache = self._sp_cache()
+        if cache is not None and "dilated" in cache:
+            return cache["dilated"]
+        polygon = self.as_sp.buffer(COORD_EPSILON, 1)
+        if cache is not None:
+            cache["dilated"] = polygon
+        return polygon
 
     @property
     def as_sp_eroded(self) -> Polygon:
         """
         Returns a dilated Polygon corresponding to the face with a small buffer
         This is useful to prevent floating point precision errors.
+        Note : the polygon is cached until the next modification of the mesh
         :return: Polygon
         """
-        return self.as_sp.buffer(-COORD_EPSILON, 1)
+        cache = self._sp_cache()
+        if cache is not None and "eroded" in cache:
+            return cache["eroded"]
+        polygon = self.as_sp.buffer(-COORD_EPSILON, 1)
+        if cache is not None:
+            cache["eroded"] = polygon
+        return polygon
 
     @property
     def area(self) -> float:
         """
         Calculates and returns the area of the face
-        We use the shapely module to compute the area
+        Note : for performance purposes we do not use shapely but compute directly
+        the area of the polygon with the shoelace formula (the coordinates are taken relative
+        to the first vertex as in GEOS)
         :return: float
         """
-        return self.as_sp.area
+        vertices = list(self.vertices)
+        number_of_vertices = len(vertices)
+        if number_of_vertices < 3:
+            return 0.0
+        x_0 = vertices[0].x
+        total = 0.0
+        for i in range(1, number_of_vertices):
+            x = vertices[i].x - x_0
+            y_previous = vertices[i - 1].y
+            y_next = vertices[(i + 1) % number_of_vertices].y
+            total += x * (y_previous - y_next)
+        return abs(total) / 2.0
 
     @property
     def cached_area(self) -> float:
@@ -1933,10 +2260,10 @@ class Face(MeshComponent):
     def length(self) -> float:
         """
         Calculates the perimeter length of the face
-        We use the shapely module to compute the perimeter
+        Note : for performance purposes we do not use shapely but sum the edges length
         :return: float
         """
-        return self.as_sp.length
+        return self.perimeter
 
     @property
     def perimeter(self) -> float:
@@ -1944,7 +2271,7 @@ class Face(MeshComponent):
         Calculate the perimeter length of the face (not using shapely)
         :return:
         """
-        return sum(map(lambda e: e.length, self.edges))
+        return sum(map(attrgetter('length'), self.edges))
 
     def distance_to(self, other: 'Face', kind: str = "max") -> float:
         """
@@ -2041,6 +2368,33 @@ class Face(MeshComponent):
 
         return max_x - min_x, max_y - min_y
 
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """
+        Returns the axis aligned bounding box of the face
+        :return: a tuple (min_x, min_y, max_x, max_y)
+        """
+        _, segments, _ = self.segments()
+        min_x, min_y = segments[:, :2].min(axis=0)
+        max_x, max_y = segments[:, :2].max(axis=0)
+        return float(min_x), float(min_y), float(max_x), float(max_y)
+
+    def is_identical(self, other: 'Face') -> bool:
+        """
+        Returns True if the other face has exactly the same vertices and the same area
+        as the face
+        :param other:
+        :return:
+        """
+        # Note : we check the bounding boxes first as it is the cheapest comparison
+        if self.bounds != other.bounds:
+            return False
+        self_coords = self.coords
+        other_coords = other.coords
+        return (len(self_coords) == len(other_coords)
+                and set(self_coords) == set(other_coords)
+                and pseudo_equal(self.area, other.area, COORD_EPSILON))
+
     def get_edge(self, vertex: Vertex) -> Optional[Edge]:
         """
         Retrieves the half edge of the face starting with the given vertex.
@@ -2060,6 +2414,14 @@ class Face(MeshComponent):
         :param other:
         :return:
         """
+        # Note : for performance purposes we first check that the bounding box of the other face
+        # is inside the bounding box of the face inflated by the dilatation (cheap rejection)
+        min_x, min_y, max_x, max_y = self.bounds
+        other_min_x, other_min_y, other_max_x, other_max_y = other.bounds
+        if (other_min_x < min_x - COORD_EPSILON or other_min_y < min_y - COORD_EPSILON
+                or other_max_x > max_x + COORD_EPSILON or other_max_y > max_y + COORD_EPSILON):
+            return False
+
         return self.as_sp_dilated.contains(other.as_sp)
 
     def crosses(self, other: 'Face') -> bool:
@@ -2095,7 +2457,7 @@ class Face(MeshComponent):
         :param other: face
         :return: self
         """
-        for edge in self.edges:
+        for edge in self.edge.siblings_list():
             edge.pair.face = other
 
         return self
@@ -2273,7 +2635,7 @@ class Face(MeshComponent):
             elif not previous_edge.pair.is_linked_to_face(self):
                 new_face = Face(self.mesh, previous_edge.pair)
                 all_faces.append(new_face)
-                for orphan_edge in previous_edge.pair.siblings:
+                for orphan_edge in previous_edge.pair.siblings_list():
                     orphan_edge.face = new_face
 
         # forward check : at the end of the loop check forward for isolation
@@ -2322,22 +2684,50 @@ class Face(MeshComponent):
         # check if the face can be inserted
         self.is_insertable(face)
 
+        # Note : for performance purposes we first check if the face is identical to the
+        # container face, in order to skip the snapping of the vertices. The vertices of the
+        # face are not snapped, so we must not add them back to the mesh.
+        if self.is_identical(face):
+            logging.debug('Mesh: The inserted face is equal to the container face : %s', face)
+            self.mesh.remove_face_and_children(face)
+            self.swap(face)
+            return []
+
         # add all pair edges to face
         face.add_exterior(self)
 
-        # create a fixed list of the face edges for ulterior navigation
-        self_edges = list(self.edges)
-
         # split the face edges if they touch a vertex of the container face
-        # TODO : this is highly inefficient as we try to intersect every edge with every vertex
+        # NOTE : to avoid intersecting every edge with every vertex, we use the spatial hash of the
+        # mesh for the snapping and a bounding box check before each projection
         # NOTE : per convention we do not modify the alignments of the receiving faces
         # this means that only the vertices and the edges of the inserted face can be modified
         # trough the snapping. If a vertex has to be created on an edge of the receiving face
         # it must be aligned with the existing edge.
+        # Note : for performance purposes, instead of trying to snap each vertex to every
+        # vertex of the container face, we only keep the close vertices of the face given
+        # by the spatial hash of the mesh (in the order of the vertices of the face)
+        self_vertices = list(self.vertices)
+        self_vertices_rank = {vertex.id: i for i, vertex in enumerate(self_vertices)}
+
+        def _snap_candidates(_vertex: Vertex) -> List[Vertex]:
+            candidates = [other for other in self.mesh.close_vertices(_vertex)
+                          if self_vertices_rank.get(other.id, None) is not None
+                          and self_vertices[self_vertices_rank[other.id]] is other]
+            return sorted(candidates, key=lambda other: self_vertices_rank[other.id])
+
+        margin = 2 * COORD_EPSILON
         for _edge in face.edges:
-            _edge.start.snap_to(*self.vertices)
-            _edge.end.snap_to(*self.vertices)
-            for _vertex in self.vertices:
+            _edge.start.snap_to(*_snap_candidates(_edge.start))
+            _edge.end.snap_to(*_snap_candidates(_edge.end))
+            # Note : for performance purposes we discard the vertices outside the bounding box
+            # of the edge (inflated to take into account the projection epsilon)
+            for _vertex in self_vertices:
+                start, end = _edge.start, _edge.end
+                if ((_vertex.x < start.x - margin and _vertex.x < end.x - margin)
+                        or (_vertex.x > start.x + margin and _vertex.x > end.x + margin)
+                        or (_vertex.y < start.y - margin and _vertex.y < end.y - margin)
+                        or (_vertex.y > start.y + margin and _vertex.y > end.y + margin)):
+                    continue
                 closest_point = project_point_on_segment(_vertex.coords, _edge.normal,
                                                          (_edge.start.coords, _edge.end.coords),
                                                          no_direction=True)
@@ -2347,16 +2737,44 @@ class Face(MeshComponent):
 
         # snap face vertices to edges of the container face
         # for performance purpose we store the snapped vertices and the corresponding edge
+        # Note : for performance purposes we compute at once the inflated bounding boxes of the
+        # edges of the container face, in order to only give to the snapping method the edges
+        # that can be close enough to each vertex. The edges created by a split keep the
+        # bounding box of the split edge, so this prefilter is coarser than the bounding box
+        # check of Vertex.snap_to_edge, which is still needed to discard these edges.
         shared_edges = []
-        face_edges = list(face.edges)
+        face_edges = face.edges_list()
+        self_edges, self_coords, _ = self.segments()
+        self_edges = self_edges[:]  # the list is cached by the face and will be modified
+        self_boxes = np.column_stack((np.minimum(self_coords[:, 0], self_coords[:, 2]) - margin,
+                                      np.minimum(self_coords[:, 1], self_coords[:, 3]) - margin,
+                                      np.maximum(self_coords[:, 0], self_coords[:, 2]) + margin,
+                                      np.maximum(self_coords[:, 1], self_coords[:, 3]) + margin))
         for edge in face_edges:
             vertex = edge.start
             vertex.edge = edge  # we need to do this to ensure proper snapping direction
-            edge_shared = vertex.snap_to_edge(*self_edges)
-            if edge_shared is not None:
-                shared_edges.append((edge_shared, edge))
-                # after a split: update list of edges
-                self_edges = list(self.edges)
+            x, y = vertex.x, vertex.y
+            close_edges = np.flatnonzero((self_boxes[:, 0] <= x) & (self_boxes[:, 1] <= y)
+                                         & (x <= self_boxes[:, 2]) & (y <= self_boxes[:, 3]))
+            edge_shared = vertex.snap_to_edge(*(self_edges[i] for i in close_edges))
+            if edge_shared is None:
+                continue
+            shared_edges.append((edge_shared, edge))
+            # after a split: update list of edges
+            # Note : for performance purposes, instead of walking again the whole face, we insert
+            # the new edges after the split edges. Only the edges given to the snapping method
+            # can have been split, and the new edges keep the bounding box of their split edge.
+            for i in close_edges[::-1]:
+                next_edge = self_edges[(i + 1) % len(self_edges)]
+                new_edges = []
+                new_edge = self_edges[i].next
+                while new_edge is not next_edge:
+                    new_edges.append(new_edge)
+                    new_edge = new_edge.next
+                if new_edges:
+                    self_edges[i + 1:i + 1] = new_edges
+                    self_boxes = np.insert(self_boxes, [i + 1] * len(new_edges), self_boxes[i],
+                                           axis=0)
 
         nb_shared_vertices = len(shared_edges)
 
@@ -2724,11 +3142,17 @@ class Mesh:
     Mesh Class
     """
 
+    __slots__ = ('_edge', '_faces', '_edges', '_vertices', '_vertices_grid', '_watchers',
+                 '_modifications', 'id', '_counter', 'version', '_cached_area',
+                 '_cached_directions', '_cached_boundary_edges')
+
     def __init__(self, _id: Optional[int] = None):
         self._edge = None  # boundary edge of the mesh
         self._faces = {}
         self._edges = {}
         self._vertices = {}
+        # spatial hash of the vertices : cells of size COORD_EPSILON
+        self._vertices_grid: Dict[Tuple[int, int], List[Vertex]] = {}
         # Watchers
         self._watchers: [Callable[['MeshComponent', str], None]] = []
         self._modifications: Dict[int,
@@ -2736,9 +3160,13 @@ class Mesh:
                                         Optional[Tuple['MeshComponentType', int]]]] = {}
         self.id = _id or uuid.uuid4()
         self._counter: int = 0
+        # incremented each time a component of the mesh is modified
+        self.version: int = 0
 
         # for caching purpose
         self._cached_area: Optional[float] = None
+        self._cached_directions: Optional[Tuple[int, List[Tuple[float, float]]]] = None
+        self._cached_boundary_edges: Optional[Tuple[int, Edge, List[Edge]]] = None
 
     def __repr__(self):
         output = 'Mesh:\n'
@@ -2755,8 +3183,13 @@ class Mesh:
         self._faces = {}
         self._edges = {}
         self._vertices = {}
+        self._vertices_grid = {}
         self._watchers = []
         self._modifications = {}
+        self.version = 0
+        self._cached_area = None
+        self._cached_directions = None
+        self._cached_boundary_edges = None
 
     def get_id(self) -> int:
         """
@@ -2965,6 +3398,9 @@ class Mesh:
             component.id = self.get_id()
 
         self.store_modification(MeshOps.ADD, component)
+        # note : a vertex without edge does not modify the edges and the faces of the mesh
+        if type(component) != Vertex or component.edge is not None:
+            self.version += 1
 
         if type(component) == Vertex:
             self._add_vertex(component)
@@ -2981,6 +3417,10 @@ class Mesh:
         :param component:
         :return:
         """
+        # note : a vertex without edge does not modify the edges and the faces of the mesh
+        if type(component) != Vertex or component.edge is not None:
+            self.version += 1
+
         if type(component) == Vertex:
             self._add_vertex(component)
 
@@ -2996,6 +3436,9 @@ class Mesh:
         :param component:
         :return:
         """
+        # note : a vertex without edge does not modify the edges and the faces of the mesh
+        if type(component) != Vertex or component.edge is not None:
+            self.version += 1
 
         if type(component) == Vertex:
             if component.id not in self._vertices:
@@ -3123,7 +3566,13 @@ class Mesh:
         :param vertex:
         :return:
         """
+        # Note : the previous occupant of the id slot is only removed from the spatial hash
+        # if it still owns the id (when swapping ids, it is still stored under its new id)
+        other = self._vertices.get(vertex.id, None)
+        if other is not None and other is not vertex and other.id == vertex.id:
+            self._remove_from_grid(other, other.x, other.y)
         self._vertices[vertex.id] = vertex
+        self._add_to_grid(vertex, vertex.x, vertex.y)
 
     def _remove_vertex(self, vertex: Vertex):
         """
@@ -3132,8 +3581,85 @@ class Mesh:
         :return:
         """
         del self._vertices[vertex.id]
+        self._remove_from_grid(vertex, vertex.x, vertex.y)
         vertex.mesh = None
 
+    @staticmethod
+    def _grid_key(x: float, y: float) -> Tuple[int, int]:
+        """
+        Returns the key of the spatial hash cell containing the point
+        :param x:
+        :param y:
+        :return:
+        """
+        return math.floor(x / COORD_EPSILON), math.floor(y / COORD_EPSILON)
+
+    def _add_to_grid(self, vertex: Vertex, x: float, y: float):
+        """
+        Adds the vertex to the spatial hash cell of the specified coordinates
+        :param vertex:
+        :param x:
+        :param y:
+        :return:
+        """
+        cell = self._vertices_grid.setdefault(self._grid_key(x, y), [])
+        for other in cell:
+            if other is vertex:
+                return
+        cell.append(vertex)
+
+    def _remove_from_grid(self, vertex: Vertex, x: float, y: float):
+        """
+        Removes the vertex from the spatial hash cell of the specified coordinates
+        :param vertex:
+        :param x:
+        :param y:
+        :return:
+        """
+        key = self._grid_key(x, y)
+        cell = self._vertices_grid.get(key, None)
+        if not cell:
+            return
+        for i, other in enumerate(cell):
+            if other is vertex:
+                del cell[i]
+                break
+        if not cell:
+            del self._vertices_grid[key]
+
+    def move_vertex(self, vertex: Vertex, x: float, y: float):
+        """
+        Updates the spatial hash of the mesh when a vertex is moved
+        :param vertex: the moved vertex
+        :param x: the previous x coordinate of the vertex
+        :param y: the previous y coordinate of the vertex
+        :return:
+        """
+        if self._vertices.get(vertex.id, None) is not vertex:
+            return
+        if self._grid_key(x, y) == self._grid_key(vertex.x, vertex.y):
+            return
+        self._remove_from_grid(vertex, x, y)
+        self._add_to_grid(vertex, vertex.x, vertex.y)
+
+    def close_vertices(self, vertex: Vertex) -> List[Vertex]:
+        """
+        Returns the vertices of the mesh that are close to the specified vertex
+        (per the Vertex.is_close pseudo equality). The vertex itself is included
+        if it belongs to the mesh.
+        We only have to check the 3x3 neighbourhood of the cell of the vertex
+        in the spatial hash of the mesh.
+        :param vertex:
+        :return: a list of vertices
+        """
+        i, j = self._grid_key(vertex.x, vertex.y)
+        output = []
+        for key in ((i + di, j + dj) for di in (-1, 0, 1) for dj in (-1, 0, 1)):
+            for other in self._vertices_grid.get(key, ()):
+                if other is vertex or vertex.is_close(other):
+                    output.append(other)
+        return output
+
     def get_vertex(self, vertex_id: int) -> Vertex:
         """
         Returns the specified vertex
@@ -3156,7 +3682,9 @@ class Mesh:
         property
         :return: the faces of the mesh
         """
-        return list(face for _, face in self._faces.items())
+        # Note : for performance purposes we copy directly the values of the dict
+        # instead of iterating over its items with a generator
+        return list(self._faces.values())
 
     def new_face_from_boundary(self, boundary: Sequence[Coords2d]) -> 'Face':
         """
@@ -3186,13 +3714,17 @@ class Mesh:
         previous_edge = initial_edge
         previous_pair_edge = None
 
+        # Note : for performance purposes we directly set the private attributes of the new
+        # components instead of using the setters, as the version of the mesh is incremented
+        # anyway when the components are added to the mesh and when the face is closed
         for point in boundary[1:]:
             new_vertex = Vertex(self, point[0], point[1])
 
             new_edge = Edge(self, new_vertex, face=initial_face)
-            new_vertex.edge = new_edge
+            new_vertex._edge = new_edge
 
-            previous_edge.next = new_edge
+            previous_edge._next = new_edge
+            previous_edge.check_size()
             new_pair_edge = Edge(self, new_vertex, previous_pair_edge, pair=previous_edge)
 
             previous_pair_edge = new_pair_edge
@@ -3226,13 +3758,14 @@ class Mesh:
         :return:
         """
         is_valid = True
+        # Note : for performance purposes we only compare each vertex with the close vertices
+        # given by the spatial hash of the mesh instead of comparing each pair of vertices
         for vertex in self.vertices:
-            for other_vertex in self.vertices:
+            for other_vertex in self.close_vertices(vertex):
                 if other_vertex is vertex:
                     continue
                 if other_vertex.distance_to(vertex) < COORD_EPSILON / 4:
-                    logging.info('Mesh: Found duplicate vertices: ' +
-                                 '{0} - {1}'.format(vertex, other_vertex))
+                    logging.info('Mesh: Found duplicate vertices: %s - %s', vertex, other_vertex)
                     is_valid = True  # Turn this off waiting for better snapping handling
         return is_valid
 
@@ -3253,17 +3786,44 @@ class Mesh:
         if value.face is not None:
             raise ValueError('An external edge cannot have a face: {0}'.format(value))
         self._edge = value
+        self.version += 1
 
     @property
     def boundary_edges(self):
         """
         Generator to retrieve all the external edges of the mesh
+        Note : the list of the boundary edges is cached until the next modification of the mesh.
+        If the mesh is modified during the iteration, we follow each edge next from the last
+        yielded edge as in Edge.siblings.
         :return: generator
         """
-        if self.boundary_edge is None:
+        edge = self.boundary_edge
+        if edge is None:
             raise ValueError('An external edge must be specified for this mesh !')
 
-        yield from self.boundary_edge.siblings
+        version = self.version
+        cached_boundary_edges = self._cached_boundary_edges
+        if (cached_boundary_edges is None or cached_boundary_edges[0] != version
+                or cached_boundary_edges[1] is not edge):
+            cached_boundary_edges = version, edge, edge.siblings_list()
+            self._cached_boundary_edges = cached_boundary_edges
+
+        for _edge in cached_boundary_edges[2]:
+            yield _edge
+            if self.version != version:
+                _edge = _edge.next
+                # in order to detect infinite loop we stored each yielded edge
+                if __debug__:
+                    seen = set()
+                while _edge is not edge:
+                    if __debug__ and id(_edge) in seen:
+                        raise Exception('Infinite loop' +
+                                        ' starting from edge:{0}'.format(edge))
+                    if __debug__:
+                        seen.add(id(_edge))
+                    yield _edge
+                    _edge = _edge.next
+                return
 
     @property
     def boundary_as_sp(self):
@@ -3302,19 +3862,38 @@ class Mesh:
         """
         Returns the main directions of the mesh as a tuple containing an angle and a length
         For each boundary edge we calculate the absolute ccw angle and we add it to a dict
+        Note : the directions are cached until the next modification of the mesh
         :return:
         """
-        directions_dict: Dict[float, float] = {}
-
-        for edge in self.boundary_edges:
-            # TODO : this should be coherent with ANGLE_EPSILON and not just an integer round
-            angle = float(round(edge.absolute_angle % 180.0))
-            if angle in directions_dict:
-                directions_dict[angle] += edge.length
-            else:
-                directions_dict[angle] = edge.length
-
-        return sorted(directions_dict.items(), key=itemgetter(1), reverse=True)
+        if self._cached_directions is not None and self._cached_directions[0] == self.version:
+            return list(self._cached_directions[1])
+
+        # Note : for performance purposes we compute the angles and the lengths of all the
+        # boundary edges at once with numpy (as in Edge.absolute_angle and Edge.length)
+        # and we sum the lengths per angle with np.bincount (using the integer angles as keys)
+        segments = np.array([(edge.start.x, edge.start.y, edge.end.x, edge.end.y)
+                             for edge in self.boundary_edges], dtype=float)
+        vectors_x = segments[:, 2] - segments[:, 0]
+        vectors_y = segments[:, 3] - segments[:, 1]
+        lengths = np.sqrt(vectors_x ** 2 + vectors_y ** 2)
+        # TODO : this should be coherent with ANGLE_EPSILON and not just an integer round
+        angles = np.round(np.degrees(np.arctan2(vectors_y, vectors_x) % (2 * math.pi)))
+        angles = np.round(angles % 360.0 % 180.0).astype(np.int64)
+        totals = np.bincount(angles, weights=lengths, minlength=180)
+        # Note : the angles are ordered by first appearance to keep the order
+        # of the directions with the same length
+        number_of_edges = len(angles)
+        first_indices = np.full(180, number_of_edges)
+        np.minimum.at(first_indices, angles, np.arange(number_of_edges))
+        unique_angles = np.flatnonzero(first_indices < number_of_edges)
+        unique_angles = unique_angles[np.argsort(first_indices[unique_angles], kind="stable")]
+        directions_dict = dict(zip(unique_angles.astype(float).tolist(),
+                                   totals[unique_angles].tolist()))
+
+        directions = sorted(directions_dict.items(), key=itemgetter(1), reverse=True)
+        self._cached_directions = self.version, directions
+
+        return list(directions)
 
     def simplify(self):
         """
@@ -3349,7 +3928,7 @@ class Mesh:
         # snap the external vertices of the mesh to the face edges
         for edge in self.boundary_edges:
             vertex = edge.start
-            face_edges = list(face.edges)
+            face_edges = face.edges_list()
             new_edge = vertex.snap_to_edge(*face_edges)
             if new_edge is not None:
                 logging.debug('Mesh: Snapped a vertex from the receiving face: %s', vertex)
@@ -3357,7 +3936,7 @@ class Mesh:
         # snap face vertices to edges of the container face
         # for performance purpose we store the snapped vertices and the corresponding edge
         shared_edges = []
-        face_edges = list(face.edges)
+        face_edges = face.edges_list()
         for edge in face_edges:
             vertex = edge.start
             vertex.edge = edge  # we need to do this to ensure proper snapping direction
@@ -3407,10 +3986,12 @@ class Mesh:
                 previous_touching_edge.remove_from_mesh()
 
             # else check for new face creation
-            elif previous_edge.pair not in self.boundary_edges:
+            # Note : for performance purposes we compare directly the ids of the boundary edges
+            # (as in MeshComponent.__eq__) instead of calling __eq__ for each edge
+            elif not any(_edge.id == previous_edge.pair.id for _edge in self.boundary_edges):
                 new_face = Face(self, previous_edge.pair)
                 all_faces.append(new_face)
-                for orphan_edge in previous_edge.pair.siblings:
+                for orphan_edge in previous_edge.pair.siblings_list():
                     orphan_edge.face = new_face
 
         # forward check : at the end of the loop check forward for isolation
@@ -3443,8 +4024,9 @@ class Mesh:
         :return: boolean
         """
         is_valid = True
-        edges_id = []
-        vertices_id = []
+        # Note : for performance purposes we store the ids in sets
+        edges_id = set()
+        vertices_id = set()
 
         for face in self.faces:
             # check for correct form
@@ -3456,56 +4038,62 @@ class Mesh:
             for edge in face.edges:
                 if edge is None:
                     is_valid = False
-                    logging.error('Mesh: Checking Mesh: Edge is None for:{0}'.format(face))
+                    logging.error('Mesh: Checking Mesh: Edge is None for:%s', face)
                     return is_valid
-                edges_id.append(edge.id)
-                vertices_id.append(edge.start.id)
+                # Note : for performance purposes we bind the attributes to local variables
+                start, pair, next_edge = edge.start, edge.pair, edge.next
+                start_edge = start.edge
+                edges_id.add(edge.id)
+                vertices_id.add(start.id)
                 # check if all component are correctly stored in mesh
                 if edge.id not in self._edges:
                     is_valid = False
                     logging.error("Mesh: Edge id not stored in mesh for edge: %s", edge)
-                if edge.start.id not in self._vertices:
+                if start.id not in self._vertices:
                     is_valid = False
-                    logging.error("Mesh: Vertex id not stored in mesh for vertex: %s", edge.start)
-                if edge.pair.id not in self._edges:
+                    logging.error("Mesh: Vertex id not stored in mesh for vertex: %s", start)
+                if pair.id not in self._edges:
                     is_valid = False
-                    logging.error("Mesh: Edge id not stored in mesh for edge: %s", edge.pair)
+                    logging.error("Mesh: Edge id not stored in mesh for edge: %s", pair)
 
                 if edge.face is not face:
                     is_valid = False
-                    logging.error('Mesh: Checking Mesh: Wrong face in edge:' +
-                                  '{0} for face:{1}'.format(edge, edge.face))
-                if edge.pair and edge.pair.pair is not edge:
+                    logging.error('Mesh: Checking Mesh: Wrong face in edge:%s for face:%s',
+                                  edge, edge.face)
+                # Note : the pair edge cannot be None here as its id was checked above
+                if pair.pair is not edge:
                     is_valid = False
-                    logging.error('Mesh: Checking Mesh: Wrong pair attribution:' +
-                                  ' {0} for face: {1}'.format(edge, edge.pair))
-                if edge.start.edge is None:
+                    logging.error('Mesh: Checking Mesh: Wrong pair attribution: %s for face: %s',
+                                  edge, pair)
+                if start_edge is None:
                     is_valid = False
-                    logging.error('Mesh: Checking Mesh: Vertex has no edge: {0}'.format(edge.start))
-                if edge.start.edge is None or edge.start.edge.start is not edge.start:
+                    logging.error('Mesh: Checking Mesh: Vertex has no edge: %s', start)
+                if start_edge is None or start_edge.start is not start:
                     is_valid = False
-                    logging.error('Mesh: Checking Mesh: Wrong edge attribution in: ' +
-                                  '{0} - {1}'.format(edge.start, edge))
-                if edge.next.next is edge:
+                    logging.error('Mesh: Checking Mesh: Wrong edge attribution in: %s - %s',
+                                  start, edge)
+                if next_edge.next is edge:
                     is_valid = False
-                    logging.error('Mesh: Checking Mesh: 2-edges face found:{0}'.format(edge))
-                if edge.next is edge.pair:
+                    logging.error('Mesh: Checking Mesh: 2-edges face found:%s', edge)
+                if next_edge is pair:
                     is_valid = False
-                    logging.warning('Mesh: Checking Mesh: folded edge found: {0}'.format(edge))
+                    logging.warning('Mesh: Checking Mesh: folded edge found: %s', edge)
 
         for edge in self.boundary_edges:
-            edges_id.append(edge.id)
-            vertices_id.append(edge.start.id)
+            edges_id.add(edge.id)
+            vertices_id.add(edge.start.id)
             if edge.face is not None:
-                logging.error('Mesh: Wrong edge in mesh boundary edges:{0}'.format(edge))
+                logging.error('Mesh: Wrong edge in mesh boundary edges:%s', edge)
                 is_valid = False
 
         is_valid = is_valid and self.check_duplicate_vertices()
 
         for vertex in self.vertices:
-            if vertex.edge not in self.edges:
-                logging.error("Mesh: Vertex has a reference edge outside of the mesh:"
-                              "{} - {}".format(vertex, vertex.edge))
+            # Note : for performance purposes we look for the id of the edge in the mesh
+            # instead of comparing the edge with each edge of the mesh
+            if vertex.edge is None or vertex.edge.id not in self._edges:
+                logging.error("Mesh: Vertex has a reference edge outside of the mesh: %s - %s",
+                              vertex, vertex.edge)
                 is_valid = False
 
         for edge_id in self._edges:
@@ -3528,7 +4116,7 @@ class Mesh:
                           faces_area, mesh_area)
             is_valid = False
 
-        logging.info('Mesh: Checking Mesh: ' + ('✅ OK' if is_valid else '❌ KO'))
+        logging.info('Mesh: Checking Mesh: %s', '✅ OK' if is_valid else '❌ KO')
         return is_valid
 
     def plot(self,
@@ -3549,9 +4137,20 @@ class Mesh:
         :param show: whether to show as matlplotlib window
         :return: ax
         """
-        for face in self.faces:
-            color = random_color()
-            ax = face.plot(ax, options, color, False)
+        faces = self.faces
+        colors = [random_color() for _ in faces]
+        face_options = options
+        # Note : for performance purposes we fill all the faces at once
+        if 'fill' in options:
+            ax = plot_polygons(ax, [face.coords for face in faces], colors)
+            face_options = tuple(option for option in options if option != 'fill')
+
+        # Note : for performance purposes we plot all the half edges at once
+        half_edges_lines = []
+        half_edges_colors = []
+
+        for face, color in zip(faces, colors):
+            ax = face.plot(ax, face_options, color, False)
 
             for edge in face.edges:
                 # display edges normal vector
@@ -3559,12 +4158,17 @@ class Mesh:
                     edge.plot_normal(ax, color)
                 # display half edges vector
                 if 'half-edges' in options:
-                    edge.plot_half_edge(ax, color, False)
+                    half_edges_lines.append(edge.half_edge_arrow())
+                    half_edges_colors.append(color)
 
         if 'boundary-edges' in options:
             color = random_color()
             for edge in self.boundary_edges:
-                edge.plot_half_edge(ax, color, False)
+                half_edges_lines.append(edge.half_edge_arrow())
+                half_edges_colors.append(color)
+
+        if half_edges_lines:
+            ax = plot_edges(ax, half_edges_lines, half_edges_colors)
 
         plot_save(save, show)
 
@@ -1079,3 +1079,135 @@ def test_cut_over_internal_edge_other_direction():
     mesh.plot()
 
     assert mesh.check()
+
+
+def test_directions_cache():
+    """
+    Test that the cached directions of the mesh are updated after a modification
+    :return:
+    """
+    mesh = rectangular_mesh(400, 800)
+    assert mesh.directions == [(90.0, 1600.0), (0.0, 800.0)]
+
+    mesh.boundary_edge.start.coords = (400, 400)
+    assert [angle for angle, _ in mesh.directions] == [90.0, 45.0, 0.0]
+
+
+def test_insert_identical_face_keeps_container():
+    """
+    Test the insertion of a face identical to the receiving face
+    :return:
+    """
+    perimeter = [(0, 0), (1000, 0), (1000, 1000), (0, 1000)]
+    mesh = Mesh().from_boundary(perimeter)
+    face = mesh.new_face_from_boundary(perimeter)
+    assert mesh.faces[0].is_identical(face)
+    assert mesh.faces[0].insert_face(face) == []
+    assert mesh.faces == [face]
+    assert len(list(mesh.vertices)) == 4
+    assert mesh.check()
+
+
+def test_boundary_edges_cache():
+    """
+    Test the boundary edges after a modification of the mesh
+    :return:
+    """
+    mesh = rectangular_mesh(400, 800)
+    boundary_edges = list(mesh.boundary_edges)
+    assert len(boundary_edges) == 4
+    assert list(mesh.boundary_edges) == boundary_edges
+    mesh.boundary_edge.split_barycenter(0.5)
+    assert len(list(mesh.boundary_edges)) == 5
+    for edge in mesh.boundary_edges:
+        if edge is mesh.boundary_edge:
+            edge.next.split_barycenter(0.5)
+    assert len(list(mesh.boundary_edges)) == 6
+    assert mesh.check()
+
+
+def test_previous_edge_cache():
+    """
+    Test the previous edge after a modification of the mesh
+    :return:
+    """
+    mesh = rectangular_mesh(400, 800)
+    face = mesh.faces[0]
+    for edge in face.edges:
+        assert edge.previous.next is edge
+    edge = face.edge
+    edge.split_barycenter(0.5)
+    for _edge in face.edges:
+        assert _edge.previous.next is _edge
+    assert edge.next.previous is edge
+    assert mesh.check()
+
+
+def test_swap_vertex_ids_keeps_spatial_hash():
+    """
+    Test the spatial hash of the vertices after swapping the ids of two vertices
+    :return:
+    """
+    mesh = rectangular_mesh(400, 800)
+    vertex_a = mesh.boundary_edge.start
+    vertex_b = mesh.boundary_edge.end
+    vertex_a.swap_id(vertex_b)
+    assert vertex_a in mesh.close_vertices(vertex_a)
+    assert vertex_b in mesh.close_vertices(vertex_b)
+    assert mesh.get_vertex(vertex_a.id) is vertex_a
+    assert mesh.get_vertex(vertex_b.id) is vertex_b
+    assert mesh.check()
+
+
+def test_insert_face_splitting_container_edge_several_times():
+    """
+    Test the insertion of a face with several vertices on the same edge of the container face
+
+     0, 500               500, 500
+       +-----------------------+
+       |                       |
+       |   100, 200            |
+       |      +-----------+    |
+       |      |  +-----+  |    |
+       |      |  |     |  |    |
+       +------+--+     +--+----+
+     0, 0                  500, 0
+
+    :return:
+    """
+    mesh = rectangular_mesh(500, 500)
+    hole = [(100, 0), (200, 0), (200, 100), (300, 100), (300, 0), (400, 0), (400, 200),
+            (100, 200)]
+    mesh.faces[0].insert_face_from_boundary(hole)
+
+    assert len(list(mesh.vertices)) == 12
+    assert len(mesh.faces) == 3
+    assert len(list(mesh.boundary_edges)) == 8
+    assert sorted(face.area for face in mesh.faces) == [10000.0, 50000.0, 190000.0]
+    assert mesh.check()
+
+
+def test_face_shapely_cache():
+    """
+    Test the shapely geometries of a face after a modification of the mesh
+    :return:
+    """
+    mesh = rectangular_mesh(400, 800)
+    face = mesh.faces[0]
+    polygon = face.as_sp
+    assert face.as_sp is polygon
+    assert polygon.area == 320000.0
+    assert len(face.as_sp_linear_ring.coords) == 5
+
+    vertex = next(_vertex for _vertex in face.vertices if _vertex.coords == (400, 800))
+    vertex.coords = (400, 1000)
+    assert face.as_sp is not polygon
+    assert face.as_sp.area == 360000.0
+    assert face.as_sp_dilated.contains(face.as_sp)
+    assert face.as_sp.contains(face.as_sp_eroded)
+
+    face.edge.split_barycenter(0.5)
+    assert len(face.as_sp.exterior.coords) == 6
+    assert len(face.as_sp_linear_ring.coords) == 6
+    assert face.as_sp.area == 360000.0
+    assert mesh.check()
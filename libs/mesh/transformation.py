@@ -12,7 +12,6 @@ from typing import Callable, Dict, Optional, TYPE_CHECKING
 
 from libs.utils.custom_types import Vector2d, Coords2d
 from libs.utils.geometry import (
-    barycenter,
     move_point,
     same_half_plane
 )
@@ -71,7 +70,11 @@ def _barycenter_action(source_vertex: 'Vertex', vertex: 'Vertex', coeff: float)
         raise ValueError('A barycenter coefficient' +
                          'should have a value between 0 and 1: {0}'.format(coeff))
 
-    return barycenter(source_vertex.coords, vertex.coords, coeff)
+    # Note : for performance purposes we inline the barycenter computation
+    # instead of building the coordinates tuples of each vertex
+    x_source, y_source = source_vertex.x, source_vertex.y
+    return (x_source + (vertex.x - x_source) * coeff,
+            y_source + (vertex.y - y_source) * coeff)
 
 
 def _translation_action(source_vertex: 'Vertex',
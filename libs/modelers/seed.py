@@ -18,6 +18,7 @@ from typing import (TYPE_CHECKING, List, Optional, Dict,
                     Generator, Sequence, Set, Tuple, Callable, Union)
 import logging
 import copy
+from operator import attrgetter
 
 import matplotlib.pyplot as plt
 
@@ -774,7 +775,7 @@ def merge_small_cells(seeder: 'Seeder', show: bool) -> List['Space']:
         return modified_spaces
 
     for small_space in sorted((s for s in seeder.plan.get_spaces("seed") if s.area < min_cell_area),
-                              key=lambda x: x.area):
+                              key=attrgetter('area')):
         # adjacent mutable spaces of small_space
         adjacent_spaces = [s for s in small_space.adjacent_spaces() if s.mutable]
         if not adjacent_spaces:
@@ -788,7 +789,7 @@ def merge_small_cells(seeder: 'Seeder', show: bool) -> List['Space']:
             continue
         # in case there are several spaces with equal contact length,
         # merge with the smallest one
-        selected = min(candidates, key=lambda s: s.area)
+        selected = min(candidates, key=attrgetter('area'))
 
         # do not merge if the selected space contains a seed as well as the small space
         if seeder.get_seed_from_space(selected) and seeder.get_seed_from_space(small_space):
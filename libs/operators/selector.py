@@ -20,6 +20,7 @@ for edge in selector.catalog['boundary'].yield_from(space):
 from typing import Sequence, Generator, Callable, Any, Optional, TYPE_CHECKING
 import math
 import logging
+from operator import attrgetter
 
 from libs.utils.geometry import (
     ccw_angle,
@@ -176,7 +177,7 @@ def boundary_faces_fixed(space: 'Space', *_) -> Generator['Edge', bool, None]:
     :return:
     """
     for face in space.faces:
-        for edge in list(face.edges):
+        for edge in face.edges_list():
             yield edge
 
 
@@ -200,7 +201,7 @@ def boundary_faces_biggest(space: 'Space', *_) -> Generator['Edge', bool, None]:
         internal_edges = [e for e in face.edges if not space.is_boundary(e)]
         if not internal_edges:
             continue
-        yield max(internal_edges, key=lambda e: e.length)
+        yield max(internal_edges, key=attrgetter('length'))
 
 
 def fixed_space_boundary(space: 'Space', *_) -> Generator['Edge', bool, None]:
@@ -338,7 +339,7 @@ def boundary_unique_longest(space: 'Space', *_) -> Generator['Edge', bool, None]
         and space.plan.get_space_of_edge(edge.pair).category.name == "seed"
     ]
     if space_edges_adjacent_to_seed:
-        edge = max(space_edges_adjacent_to_seed, key=lambda edge: edge.length)
+        edge = max(space_edges_adjacent_to_seed, key=attrgetter('length'))
         yield edge
     else:
         return
@@ -700,7 +701,7 @@ def small_faces(max_area: float = 2500.0) -> EdgeQuery:
                 internal_edges = [e for e in face.edges if not space.is_boundary(e)]
                 if not internal_edges:
                     continue
-                yield max(internal_edges, key=lambda e: e.length)
+                yield max(internal_edges, key=attrgetter('length'))
 
     return _query
 
@@ -1066,7 +1067,7 @@ def _line_cuts_angle(line: ['Edge'], space: 'Space') -> bool:
             continue
         if not space.is_internal(edge):
             continue
-        edges = list(edge.end.edges)
+        edges = edge.end.edges_list()
         if len(edges) != 4:
             continue
         edges = list(filter(lambda e: e not in (line[i], line[i + 1],
@@ -23,6 +23,7 @@ from typing import (
 import logging
 import uuid
 from enum import Enum
+from operator import attrgetter
 
 import matplotlib.pyplot as plt
 from shapely.geometry import Polygon, LineString, LinearRing
@@ -30,7 +31,6 @@ from shapely.geometry import Polygon, LineString, LinearRing
 from libs.mesh.mesh import Mesh, Face, Edge, Vertex, MeshOps, MeshComponentType
 from libs.plan.category import LinearCategory, SpaceCategory, SPACE_CATEGORIES, LINEAR_CATEGORIES
 from libs.read_write.plot import plot_save, plot_edge, plot_polygon
-import libs.mesh.transformation as transformation
 from libs.specification.size import Size
 from libs.equipments.furniture import Furniture
 from libs.utils.custom_types import Coords2d, TwoEdgesAndAFace, Vector2d, FourCoords2d
@@ -228,7 +228,7 @@ class Space(PlanComponent):
         The face of the reference edge of the space
         :return:
         """
-        return max(list(self.faces), key=lambda face: face.area)
+        return max(list(self.faces), key=attrgetter('area'))
 
     def has_face(self, face: 'Face') -> bool:
         """
@@ -266,7 +266,9 @@ class Space(PlanComponent):
         :return:
         """
         if linear.floor == self.floor:
-            return linear.edge.face in self.faces
+            # Note : for performance purposes we look for the id of the face in the space
+            # instead of comparing the face with each face of the space
+            return self.has_face(linear.edge.face)
         else:
             return False
 
@@ -917,7 +919,7 @@ class Space(PlanComponent):
         #     |                   |
         #     +-------------------+
 
-        face_edges = list(face.edges)
+        face_edges = face.edges_list()
         for edge in self.exterior_edges:
             if edge.pair not in face_edges:
                 break
@@ -1055,7 +1057,7 @@ class Space(PlanComponent):
         #     |    +---------+    |
         #     |                   |
         #     +-------------------+
-        face_edges = list(face.edges)
+        face_edges = face.edges_list()
         for edge in face_edges:
             if self.is_outside(edge.pair):
                 break
@@ -1099,7 +1101,7 @@ class Space(PlanComponent):
             return [self]
 
         # case 4 : standard case
-        forbidden_edges = list(face.edges)
+        forbidden_edges = face.edges_list()
         self.change_reference_edges(forbidden_edges)
 
         # We must check if we are creating one or several
@@ -1329,11 +1331,12 @@ class Space(PlanComponent):
         def _propagate(current_face: Face) -> Generator[Face, None, None]:
             for adjacent_face in self.adjacent_faces(current_face):
                 if adjacent_face not in seen:
-                    seen.append(adjacent_face)
+                    seen.add(adjacent_face)
                     yield adjacent_face
                     yield from _propagate(adjacent_face)
 
-        seen = [face]
+        # Note : for performance purposes we use a set (faces are hashed by id)
+        seen = {face}
         return _propagate(face)
 
     def adjacent_faces(self, face: Face) -> Generator[Face, None, None]:
@@ -1344,11 +1347,12 @@ class Space(PlanComponent):
         """
         assert self.has_face(face), "The face must belong to the space"
 
-        seen = [face]
+        # Note : for performance purposes we use a set (faces are hashed by id)
+        seen = {face}
         for edge in face.edges:
             if self.has_face(edge.pair.face) and edge.pair.face not in seen:
                 yield edge.pair.face
-                seen.append(edge.pair.face)
+                seen.add(edge.pair.face)
 
     def face_is_adjacent(self, face: Face) -> bool:
         """
@@ -1545,9 +1549,7 @@ class Space(PlanComponent):
         :return:
         """
         edge = edge or self.edge
-        vertex = (transformation.get['barycenter']
-                  .config(vertex=edge.end, coeff=coeff)
-                  .apply_to(edge.start))
+        vertex = edge.barycenter(coeff)
 
         cut_data = self.cut(edge, vertex, angle, vector, traverse, max_length)
 
@@ -3071,7 +3073,7 @@ class Plan:
         The largest empty space of the plan
         :return:
         """
-        return max(self.empty_spaces, key=lambda space: space.area)
+        return max(self.empty_spaces, key=attrgetter('area'))
 
     @property
     def directions(self) -> Sequence[Tuple[float, float]]:
@@ -12,6 +12,7 @@ from shapely.geometry import LineString
 from typing import Sequence
 import matplotlib.pyplot as plt
 from matplotlib.patches import Polygon
+from matplotlib.collections import LineCollection, PolyCollection
 import numpy as np
 
 from libs.utils.custom_types import Vector2d, Coords2d
@@ -136,6 +137,59 @@ def plot_polygon(_ax,
     return _ax
 
 
+def plot_edges(_ax,
+               lines: Sequence[Sequence[Coords2d]],
+               colors: Sequence[str],
+               width: float = 1.0,
+               alpha: float = 1):
+    """
+    Plots several edges at once with matplotlib
+    Note : for performance purposes we use a single LineCollection instead of calling
+    the plot method of the axes for each edge
+    :param _ax:
+    :param lines: list of the coordinates of each line
+    :param colors: list of matplotlib colors, one for each line
+    :param width:
+    :param alpha:
+    :return:
+    """
+    if _ax is None:
+        fig, _ax = plt.subplots()
+        _ax.set_aspect('equal')
+
+    collection = LineCollection(lines, colors=colors, linewidths=width, alpha=alpha,
+                                capstyle='butt')
+    _ax.add_collection(collection)
+    _ax.autoscale_view()
+
+    return _ax
+
+
+def plot_polygons(_ax,
+                  polygons: Sequence[Sequence[Coords2d]],
+                  colors: Sequence[str],
+                  alpha: Optional[float] = 0.3):
+    """
+    Fills several polygons at once with matplotlib
+    Note : for performance purposes we use a single PolyCollection instead of calling
+    the fill method of the axes for each polygon
+    :param _ax:
+    :param polygons: list of the coordinates of each polygon
+    :param colors: list of matplotlib colors, one for each polygon
+    :param alpha:
+    :return:
+    """
+    if _ax is None:
+        fig, _ax = plt.subplots()
+        _ax.set_aspect('equal')
+
+    collection = PolyCollection(polygons, facecolors=colors, edgecolors=colors, alpha=alpha)
+    _ax.add_collection(collection)
+    _ax.autoscale_view()
+
+    return _ax
+
+
 def make_arrow(point: Coords2d, vector: Vector2d, normal: Vector2d) -> LineString:
     """
     Returns a polyline of the form o a semi-arrow translated from original edge
@@ -26,6 +26,7 @@ import random
 import math
 import logging
 import multiprocessing
+from operator import attrgetter
 from typing import TYPE_CHECKING, Optional, Callable, List, Union, Tuple
 
 from libs.plan.plan import Plan
@@ -171,7 +172,7 @@ class Refiner:
         :return:
         """
         results = self.run(solution, params)
-        output = max(results, key=lambda i: i.fitness.wvalue)
+        output = max(results, key=attrgetter('fitness.wvalue'))
 
         # clean unnecessary circulation
         output.plot()
@@ -457,7 +458,7 @@ def nsga_ga(toolbox: 'core.Toolbox',
         toolbox.evaluate_pop(toolbox.map, toolbox.evaluate, offspring, chunk_size)
 
         # best score
-        best_ind = max(offspring, key=lambda i: i.fitness.wvalue)
+        best_ind = max(offspring, key=attrgetter('fitness.wvalue'))
         logging.info("Best : {:.2f} - {}".format(best_ind.fitness.wvalue, best_ind.fitness.values))
 
         # Select the next generation population
@@ -498,7 +499,7 @@ def space_nsga_ga(toolbox: 'core.Toolbox',
     # no actual selection is done
     pop = toolbox.select(pop, len(pop))
 
-    best_fitness = max(pop, key=lambda i: i.fitness.wvalue).fitness.wvalue
+    best_fitness = max(pop, key=attrgetter('fitness.wvalue')).fitness.wvalue
     no_improvement_count = 0
 
     # Begin the generational process
@@ -586,11 +587,11 @@ def naive_ga(toolbox: 'core.Toolbox',
         toolbox.evaluate_pop(toolbox.map, toolbox.evaluate, offspring, chunk_size)
 
         # best score
-        best_ind = max(offspring, key=lambda i: i.fitness.wvalue)
+        best_ind = max(offspring, key=attrgetter('fitness.wvalue'))
         logging.info("Best : {:.2f} - {}".format(best_ind.fitness.wvalue, best_ind.fitness.values))
 
         # Select the next generation population
-        pop = sorted(pop + offspring, key=lambda i: i.fitness.wvalue, reverse=True)
+        pop = sorted(pop + offspring, key=attrgetter('fitness.wvalue'), reverse=True)
         pop = pop[:mu]
 
         # store best individuals in hof
@@ -3,6 +3,7 @@ Selection Module for Refiner
 """
 import random
 import logging
+from operator import attrgetter
 
 from typing import TYPE_CHECKING, List
 
@@ -27,7 +28,7 @@ def elite_select(mutate_func: 'MutateFunc',
     :return:
     """
     # note we need to reverse because fitness values are negative
-    pop.sort(key=lambda _i: _i.fitness.wvalue, reverse=True)
+    pop.sort(key=attrgetter('fitness.wvalue'), reverse=True)
     len_pop = len(pop)
     elite_size = int(len_pop*ratio)
     elite_pop = []
@@ -26,7 +26,14 @@ def truncate(value: float, decimals: int = COORD_DECIMAL) -> float:
     :param decimals:
     :return:
     """
-    return float(np.around(float(value), decimals=decimals))
+    # Note : for performance purposes we use the math module instead of numpy
+    # as we only round a scalar value. We reproduce the algorithm of np.around
+    # (scaling, rounding half to even and unscaling) to get the exact same results
+    factor = 10.0 ** decimals
+    scaled = float(value) * factor
+    if not math.isfinite(scaled):
+        return scaled / factor
+    return math.copysign(round(scaled), scaled) / factor
 
 
 def magnitude(vector: Vector2d) -> float:
@@ -35,8 +42,9 @@ def magnitude(vector: Vector2d) -> float:
     :param vector: vector as a tuple
     :return: float
     """
-    mag = np.sqrt(vector[0] ** 2 + vector[1] ** 2)
-    return mag
+    # Note : for performance purposes we use the math module instead of numpy
+    # as we only compute a scalar value
+    return math.sqrt(vector[0] ** 2 + vector[1] ** 2)
 
 
 def direction_vector(point_1: Coords2d, point_2: Coords2d) -> Vector2d:
@@ -56,12 +64,14 @@ def ccw_angle(vector_1: Vector2d, vector_2: Optional[Vector2d] = None) -> float:
     :param vector_2: tuple
     :return: float, angle in deg
     """
-    ang1 = np.arctan2(*vector_1[::-1])
-    ang2 = ang1 if vector_2 is None else np.arctan2(*vector_2[::-1])
+    # Note : for performance purposes we use the math module instead of numpy
+    # as we only compute scalar values
+    ang1 = math.atan2(vector_1[1], vector_1[0])
+    ang2 = ang1 if vector_2 is None else math.atan2(vector_2[1], vector_2[0])
     ang1 = 0 if vector_2 is None else ang1
-    ang = np.rad2deg((ang2 - ang1) % (2 * np.pi))
+    ang = math.degrees((ang2 - ang1) % (2 * math.pi))
     # WARNING : we round the angle to prevent floating point error
-    return np.round(ang) % 360.0
+    return round(ang) % 360.0
 
 
 def nearest_point(point: Point, perimeter: LinearRing) -> Point:
@@ -110,17 +120,34 @@ def scale_line(line_string: LineString, ratio: float) -> LineString:
     return sp.affinity.scale(line_string, ratio, ratio)
 
 
+def _unit_vector(angle: float) -> Vector2d:
+    """
+    Computes a unit vector oriented according to angle
+    :param angle: float : an angle in degrees between [0, 360[
+    :return: a vector tuple
+    """
+    # convert angle to range [-pi, pi]
+    angle = angle - 360 if angle > 180 else angle
+    rad = angle * math.pi / 180
+    return truncate(math.cos(rad)), truncate(math.sin(rad))
+
+
+# Note : for performance purposes we precompute the unit vectors of the integer angles,
+# as ccw_angle returns rounded angles (for example when cutting an edge with a given angle)
+_INTEGER_ANGLES_UNIT_VECTORS: Dict[int, Vector2d] = {_angle: _unit_vector(_angle)
+                                                     for _angle in range(360)}
+
+
 def unit_vector(angle: float) -> Vector2d:
     """
     Returns a unit vector oriented according to angle
     :param angle: float : an angle in degrees
     :return: a vector tuple
     """
-    # convert angle to range [-pi, pi]
+    # note : the angle is positive after the modulo
     angle %= 360
-    angle = angle - 360 * np.sign(angle) if np.abs(angle) > 180 else angle
-    rad = angle * np.pi / 180
-    return truncate(np.cos(rad)), truncate(np.sin(rad))
+    vector = _INTEGER_ANGLES_UNIT_VECTORS.get(angle, None)
+    return vector if vector is not None else _unit_vector(angle)
 
 
 def normal_vector(vector: Vector2d) -> Vector2d:
@@ -253,7 +280,7 @@ def pseudo_equal(value: float, other: float, epsilon: float) -> bool:
     :param epsilon: float
     :return: boolean
     """
-    return other + epsilon > value > other - epsilon
+    return abs(value - other) < epsilon
 
 
 def distance(point_1: Coords2d, point_2: Coords2d) -> float:
@@ -366,6 +393,42 @@ def project_point_on_segment(point: Coords2d,
     return b[0] + t * v[0], b[1] + t * v[1]
 
 
+def project_point_on_segments(point: Coords2d,
+                              vector: Coords2d,
+                              segments: np.ndarray,
+                              no_direction: bool = False,
+                              epsilon: float = 1.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized version of project_point_on_segment : computes the projections of a point
+    along a specified vector unto each segment of an array.
+    :param point:
+    :param vector:
+    :param segments: an array of shape (n, 4) of the segments coordinates (x1, y1, x2, y2)
+    :param no_direction: if True, the projection does not need to be in the direction of the
+    vector
+    :param epsilon: the distance allowed to the extremities of the segments
+    :return: the arrays of the x and y coordinates of the projected points and a boolean array
+    indicating for each segment if an intersection was found
+    """
+    a = point
+    u = vector
+    b_x, b_y = segments[:, 0], segments[:, 1]
+    v_x, v_y = segments[:, 2] - b_x, segments[:, 3] - b_y
+    d = (v_x * u[1] - u[0] * v_y)
+    abx = a[0] - b_x
+    aby = a[1] - b_y
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = 1 / d * (u[1] * abx - u[0] * aby)
+        len_segment = np.sqrt(v_x ** 2 + v_y ** 2)
+        relative_epsilon = epsilon / len_segment
+        # Note : we use negations to keep the same behavior as project_point_on_segment
+        found = (d != 0) & ~(t > 1 + relative_epsilon) & ~(t < -relative_epsilon)
+        if not no_direction:
+            p = 1 / d * (v_y * abx - v_x * aby)
+            found &= ~(p < -relative_epsilon)
+        return b_x + t * v_x, b_y + t * v_y, found
+
+
 def min_section(perimeter: List[Coords2d]) -> float:
     """
     Returns the minimum section of the perimeter.
@@ -5,6 +5,7 @@ Test module for geometry
 
 import libs.utils.geometry as geometry
 import math
+import numpy as np
 
 
 def test_rectangle():
@@ -66,6 +67,22 @@ def test_segment_projection():
                                              epsilon=0.4) is None
 
 
+def test_segments_projection():
+    """
+    Test
+    :return:
+    """
+    segments = [((-10, 10), (10, 10)), ((10, 0), (0, 10)), ((10, 0), (10, 8.9)),
+                ((10, 0), (10, 9.5)), ((0, 0), (10, 0))]
+    x, y, found = geometry.project_point_on_segments((0, 0), (1, 1),
+                                                     np.array([s[0] + s[1] for s in segments]))
+    for i, segment in enumerate(segments):
+        point = geometry.project_point_on_segment((0, 0), (1, 1), segment)
+        assert found[i] == (point is not None)
+        if point is not None:
+            assert (x[i], y[i]) == point
+
+
 def test_min_depth():
     """
     Test